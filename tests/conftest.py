@@ -1,35 +1,45 @@
+import httpx
 import pytest
-import sys
-from pathlib import Path
+import pytest_asyncio
 from fastapi.testclient import TestClient
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from app import app, activities
 
+# Initial participant lists, captured once when the test session starts
+_PRISTINE = {name: data["participants"][:] for name, data in activities.items()}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a test client for the FastAPI app, shared across the session"""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_client():
+    """Create an async client that talks to the ASGI app directly
+
+    ASGITransport does not run lifespan events, so the app's lifespan is
+    entered here on the same event loop the client's requests run on.
+    """
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            yield ac
+
+
+@pytest.fixture
+def state():
+    """Expose the in-memory activities database for direct assertions"""
+    return activities
 
 
 @pytest.fixture
 def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original = {}
-    for activity_name, activity_data in activities.items():
-        original[activity_name] = {
-            "description": activity_data["description"],
-            "schedule": activity_data["schedule"],
-            "max_participants": activity_data["max_participants"],
-            "participants": activity_data["participants"].copy()
-        }
-    
+    """Reset activities to initial state after each test"""
     yield
-    
-    # Restore original state after test
-    for activity_name in activities:
-        activities[activity_name]["participants"] = original[activity_name]["participants"].copy()
+
+    # Restore in place so the existing list objects are reused
+    for name, participants in _PRISTINE.items():
+        activities[name]["participants"][:] = participants
@@ -1,5 +1,9 @@
+import asyncio
+
 import pytest
 
+CHESS_SIGNUP = "/activities/Chess%20Club/signup"
+
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
@@ -40,38 +44,36 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_new_participant(self, client, reset_activities):
-        """Test signing up a new participant"""
+    @pytest.mark.parametrize("activity,email", [
+        ("Chess Club", "newstudent@mergington.edu"),
+        ("Tennis Club", "test@mergington.edu"),
+        ("Art Studio", "student+2024@mergington.edu"),
+    ])
+    def test_signup_new_participant(
+        self, client, state, reset_activities, activity, email
+    ):
+        """Test that signing up a new participant adds them to the activity"""
         response = client.post(
-            "/activities/Chess%20Club/signup?email=newstudent@mergington.edu"
+            f"/activities/{activity}/signup", params={"email": email}
         )
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
-        assert "newstudent@mergington.edu" in data["message"]
-
-    def test_signup_adds_participant_to_activity(self, client, reset_activities):
-        """Test that signup actually adds participant to activity"""
-        response = client.post(
-            "/activities/Tennis%20Club/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 200
+        assert email in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert "test@mergington.edu" in activities["Tennis Club"]["participants"]
+        assert email in state[activity]["participants"]
 
     def test_signup_duplicate_participant_returns_error(self, client, reset_activities):
         """Test that signing up twice returns error"""
         email = "duplicate@mergington.edu"
         
         # First signup should succeed
-        response1 = client.post(f"/activities/Chess%20Club/signup?email={email}")
+        response1 = client.post(CHESS_SIGNUP, params={"email": email})
         assert response1.status_code == 200
         
         # Second signup should fail
-        response2 = client.post(f"/activities/Chess%20Club/signup?email={email}")
+        response2 = client.post(CHESS_SIGNUP, params={"email": email})
         assert response2.status_code == 400
         data = response2.json()
         assert "already signed up" in data["detail"]
@@ -79,57 +81,46 @@ class TestSignupForActivity:
     def test_signup_nonexistent_activity_returns_404(self, client):
         """Test that signing up for non-existent activity returns 404"""
         response = client.post(
-            "/activities/Fake%20Activity/signup?email=test@mergington.edu"
+            "/activities/Fake%20Activity/signup",
+            params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
 
-    def test_signup_with_special_characters_in_email(self, client, reset_activities):
-        """Test signing up with special characters in email"""
-        email = "student+2024@mergington.edu"
-        response = client.post(
-            f"/activities/Art%20Studio/signup?email={email}"
-        )
-        assert response.status_code == 200
-
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_existing_participant(self, client, reset_activities):
-        """Test unregistering an existing participant"""
-        email = "test@mergington.edu"
-        
+    @pytest.mark.parametrize("activity,email", [
+        ("Basketball Team", "test@mergington.edu"),
+        ("Drama Club", "student+2024@mergington.edu"),
+    ])
+    def test_unregister_existing_participant(
+        self, client, state, reset_activities, activity, email
+    ):
+        """Test that unregistering an existing participant removes them"""
         # First sign up
-        client.post(f"/activities/Basketball%20Team/signup?email={email}")
+        signup_response = client.post(
+            f"/activities/{activity}/signup", params={"email": email}
+        )
+        assert signup_response.status_code == 200
         
         # Then unregister
         response = client.delete(
-            f"/activities/Basketball%20Team/unregister?email={email}"
+            f"/activities/{activity}/unregister", params={"email": email}
         )
         assert response.status_code == 200
         data = response.json()
         assert "Unregistered" in data["message"]
-
-    def test_unregister_removes_participant(self, client, reset_activities):
-        """Test that unregister actually removes participant"""
-        email = "test@mergington.edu"
-        
-        # Sign up
-        client.post(f"/activities/Basketball%20Team/signup?email={email}")
-        
-        # Unregister
-        client.delete(f"/activities/Basketball%20Team/unregister?email={email}")
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
-        assert email not in activities["Basketball Team"]["participants"]
+        assert email not in state[activity]["participants"]
 
     def test_unregister_nonexistent_participant_returns_error(self, client):
         """Test that unregistering non-existent participant returns error"""
         response = client.delete(
-            "/activities/Chess%20Club/unregister?email=notregistered@mergington.edu"
+            "/activities/Chess%20Club/unregister",
+            params={"email": "notregistered@mergington.edu"}
         )
         assert response.status_code == 400
         assert "not signed up" in response.json()["detail"]
@@ -137,7 +128,8 @@ class TestUnregisterFromActivity:
     def test_unregister_nonexistent_activity_returns_404(self, client):
         """Test that unregistering from non-existent activity returns 404"""
         response = client.delete(
-            "/activities/Fake%20Activity/unregister?email=test@mergington.edu"
+            "/activities/Fake%20Activity/unregister",
+            params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 404
         assert "Activity not found" in response.json()["detail"]
@@ -157,48 +149,55 @@ class TestRootEndpoint:
 class TestIntegration:
     """Integration tests for complete workflows"""
 
-    def test_full_signup_and_unregister_flow(self, client, reset_activities):
+    def test_full_signup_and_unregister_flow(self, client, state, reset_activities):
         """Test complete signup and unregister flow"""
         email = "integration@mergington.edu"
-        activity = "Programming%20Class"
+        activity = "Programming Class"
         
-        # Check initial state
-        activities_response = client.get("/activities")
-        initial_count = len(activities_response.json()["Programming Class"]["participants"])
+        # The endpoints mutate this list in place, so it always reflects current state
+        participants = state[activity]["participants"]
+        initial_count = len(participants)
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        signup_response = client.post(
+            f"/activities/{activity}/signup", params={"email": email}
+        )
         assert signup_response.status_code == 200
         
         # Verify added
-        activities_response = client.get("/activities")
-        after_signup_count = len(activities_response.json()["Programming Class"]["participants"])
-        assert after_signup_count == initial_count + 1
+        assert len(participants) == initial_count + 1
+        assert email in participants
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        unregister_response = client.delete(
+            f"/activities/{activity}/unregister", params={"email": email}
+        )
         assert unregister_response.status_code == 200
         
         # Verify removed
-        activities_response = client.get("/activities")
-        final_count = len(activities_response.json()["Programming Class"]["participants"])
-        assert final_count == initial_count
+        assert len(participants) == initial_count
+        assert email not in participants
 
-    def test_multiple_participants_in_same_activity(self, client, reset_activities):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_multiple_participants_in_same_activity(
+        self, async_client, state, reset_activities
+    ):
         """Test multiple participants can sign up for same activity"""
-        activity = "Gym%20Class"
+        activity = "Gym Class"
         emails = [
             "student1@mergington.edu",
             "student2@mergington.edu",
             "student3@mergington.edu"
         ]
         
-        for email in emails:
-            response = client.post(f"/activities/{activity}/signup?email={email}")
+        responses = await asyncio.gather(*(
+            async_client.post(f"/activities/{activity}/signup", params={"email": email})
+            for email in emails
+        ))
+        for response in responses:
             assert response.status_code == 200
         
         # Verify all are registered
-        activities_response = client.get("/activities")
-        participants = activities_response.json()["Gym Class"]["participants"]
+        participants = state[activity]["participants"]
         for email in emails:
             assert email in participants